@@ -1,12 +1,22 @@
 """Fleet utilization forecasting MVP package."""
 
 from .data import load_dataset, train_test_split_time_series
-from .pipeline import PipelineResult, forecast_future, run_training_pipeline
+from .pipeline import (
+    PipelineResult,
+    forecast_future,
+    run_rolling_cv,
+    run_training_pipeline,
+    run_training_pipeline_all,
+    walk_forward_backtest,
+)
 
 __all__ = [
     "load_dataset",
     "train_test_split_time_series",
     "PipelineResult",
     "run_training_pipeline",
+    "run_training_pipeline_all",
     "forecast_future",
+    "walk_forward_backtest",
+    "run_rolling_cv",
 ]
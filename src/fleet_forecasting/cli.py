@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import argparse
+from dataclasses import fields
 from pathlib import Path
 from typing import Optional
 
-from . import data as data_utils
+import pandas as pd
+
+from .data import write_csv
 from .pipeline import MODEL_REGISTRY, forecast_future, run_training_pipeline
 
 
@@ -55,23 +58,24 @@ def train_and_forecast(
     result = run_training_pipeline(model_name=model_name, dataset_path=dataset_path, test_days=test_days)
     print(f"Model: {result.model_name}")
     print("Evaluation metrics (test set):")
-    for key, value in result.metrics.to_dict().items():
-        print(f"  {key}: {value:.4f}")
-
-    data = data_utils.load_dataset(dataset_path) if dataset_path else data_utils.load_dataset()
-    model_cls = MODEL_REGISTRY[result.model_name]
-    model = model_cls()
-    model.fit(data)
+    for metric in fields(result.metrics):
+        print(f"  {metric.name}: {getattr(result.metrics, metric.name):.4f}")
 
-    future_forecast = forecast_future(model, data, periods=future_periods)
+    future_forecast = forecast_future(result.full_model, result.data, periods=future_periods)
     print(f"\nForecast for the next {future_periods} days:")
     print(future_forecast[["ds", "yhat", "yhat_lower", "yhat_upper"]].head())
 
     if export_path:
-        export_df = future_forecast[["ds", "yhat", "yhat_lower", "yhat_upper"]].rename(
-            columns={"ds": "date", "yhat": "utilization_rate"}
+        export_df = pd.DataFrame(
+            {
+                "date": future_forecast["ds"].to_numpy(),
+                "utilization_rate": future_forecast["yhat"].to_numpy(),
+                "yhat_lower": future_forecast["yhat_lower"].to_numpy(),
+                "yhat_upper": future_forecast["yhat_upper"].to_numpy(),
+            },
+            copy=False,
         )
-        export_df.to_csv(export_path, index=False)
+        write_csv(export_df, export_path)
         print(f"\nSaved future forecast to {export_path}")
 
 
@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+import io
 import logging
+import os
+import tempfile
 from pathlib import Path
-from typing import IO, Iterable, Tuple
+from typing import IO, Dict, Iterable, Tuple
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+from pandas.tseries.api import guess_datetime_format
 
 
 LOGGER = logging.getLogger(__name__)
@@ -14,31 +22,188 @@ LOGGER = logging.getLogger(__name__)
 DEFAULT_DATA_PATH = Path(__file__).resolve().parents[2] / "data" / "fleet_utilization_sample.csv"
 DATE_COLUMN_CANDIDATES = ("ds", "date", "datetime", "timestamp", "day")
 TARGET_COLUMN_CANDIDATES = ("utilization_rate", "utilization", "utilisation_rate")
+FLEET_COLUMN_DTYPES = {
+    "total_fleet": "int32",
+    "active_vehicles": "int32",
+    "idle_vehicles": "int32",
+    "maintenance_events": "int32",
+    "miles_driven": "float32",
+    "fuel_consumed_gallons": "float32",
+    "utilization_rate": "float32",
+}
+CSV_BLOCK_SIZE = 4 << 20
 
 
-def _read_csv(csv_source: Path | str | IO[str] | IO[bytes]) -> pd.DataFrame:
+def _read_csv_table(source: Path | IO[bytes]) -> pa.Table:
+    read_options = pacsv.ReadOptions(use_threads=True, block_size=CSV_BLOCK_SIZE)
+    convert_options = pacsv.ConvertOptions(
+        column_types={name: pa.type_for_alias(alias) for name, alias in FLEET_COLUMN_DTYPES.items()}
+    )
+    # Blocks are decoded on Arrow's thread pool while the next one is read, so parsing
+    # overlaps with I/O. Types are inferred from the first block; a later block that
+    # disagrees raises ArrowInvalid and the caller falls back to pandas.
+    if isinstance(source, Path):
+        # Local files are parsed straight from mapped pages instead of being read into a buffer.
+        with pa.memory_map(str(source), "r") as mapped:
+            with pacsv.open_csv(mapped, read_options=read_options, convert_options=convert_options) as reader:
+                return reader.read_all()
+    with pacsv.open_csv(source, read_options=read_options, convert_options=convert_options) as reader:
+        return reader.read_all()
+
+
+def _table_to_pandas(table: pa.Table) -> pd.DataFrame:
+    return table.to_pandas(self_destruct=True, date_as_object=False)
+
+
+def _cache_key(path: Path) -> Dict[bytes, bytes]:
+    stat = path.stat()
+    return {
+        b"source_mtime_ns": str(stat.st_mtime_ns).encode(),
+        b"source_size": str(stat.st_size).encode(),
+    }
+
+
+def _cache_path(path: Path) -> Path:
+    return path.with_name(f"{path.name}.cache.parquet")
+
+
+def _write_cache(table: pa.Table, cache_path: Path) -> None:
+    # Written beside the target and renamed into place, so readers never see a partial file.
+    fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, prefix=f".{cache_path.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        pq.write_table(table, tmp_name, compression="zstd")
+        os.replace(tmp_name, cache_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _read_with_cache(path: Path) -> pd.DataFrame | None:
+    """Return the parsed CSV, reusing a Parquet copy stored next to it when fresh."""
+
+    cache_path = _cache_path(path)
+    key = _cache_key(path)
+    writable = True
+    if cache_path.exists():
+        try:
+            metadata = pq.read_schema(cache_path).metadata or {}
+            if all(metadata.get(name) == value for name, value in key.items()):
+                return _table_to_pandas(pq.read_table(cache_path))
+            # A file without our key was not written by this cache; leave it alone.
+            writable = all(name in metadata for name in key)
+        except (OSError, pa.ArrowInvalid) as exc:
+            LOGGER.warning("Ignoring unreadable dataset cache at %s: %s", cache_path, exc)
+            writable = False
+
+    try:
+        table = _read_csv_table(path)
+    except pa.ArrowInvalid as exc:
+        LOGGER.warning("Falling back to the pandas CSV parser: %s", exc)
+        return None
+
+    if not writable:
+        LOGGER.warning("Not overwriting %s, which is not a dataset cache", cache_path)
+        return _table_to_pandas(table)
+    try:
+        _write_cache(table.replace_schema_metadata({**(table.schema.metadata or {}), **key}), cache_path)
+    except OSError as exc:
+        LOGGER.warning("Unable to write dataset cache to %s: %s", cache_path, exc)
+    return _table_to_pandas(table)
+
+
+def _read_csv(csv_source: Path | str | IO[str] | IO[bytes], use_cache: bool = True) -> pd.DataFrame:
     if hasattr(csv_source, "read"):
-        return pd.read_csv(csv_source)  # type: ignore[arg-type]
-    path = Path(csv_source)
-    if not path.exists():
-        raise FileNotFoundError(f"Dataset not found at {path}")
-    return pd.read_csv(path)
+        source = csv_source
+    else:
+        source = Path(csv_source)
+        if not source.exists():
+            raise FileNotFoundError(f"Dataset not found at {source}")
+        if use_cache:
+            cached = _read_with_cache(source)
+            if cached is not None:
+                return cached
+            return _read_csv_pandas(source)
+
+    if isinstance(source, io.TextIOBase):
+        # Arrow's reader only takes bytes; re-encoding keeps text streams on the fast path.
+        source = io.BytesIO(source.read().encode("utf-8"))
+    start = source.tell() if hasattr(source, "seek") else None
+    try:
+        return _table_to_pandas(_read_csv_table(source))  # type: ignore[arg-type]
+    except pa.ArrowInvalid as exc:
+        # Dirty values fail the typed schema; the pandas parser coerces them instead.
+        LOGGER.warning("Falling back to the pandas CSV parser: %s", exc)
+        if start is not None:
+            source.seek(start)  # type: ignore[union-attr]
+    return _read_csv_pandas(source)
+
+
+def _read_csv_pandas(source: Path | IO[bytes]) -> pd.DataFrame:
+    # Without a schema the Arrow engine infers dirty columns as strings for later coercion.
+    return pd.read_csv(source, engine="pyarrow")
+
+
+def _parse_dates(values: pd.Series) -> pd.Series:
+    """Convert a date column to tz-naive UTC ``datetime64[ns]``, parsing strings with one format."""
+
+    # Arrow infers second or millisecond units; pin nanoseconds so every load path agrees.
+    if pd.api.types.is_datetime64_any_dtype(values):
+        if getattr(values.dt, "tz", None) is not None:
+            values = values.dt.tz_convert("UTC").dt.tz_localize(None)
+        return values.dt.as_unit("ns")
+
+    first_valid = values.first_valid_index()
+    date_format = guess_datetime_format(str(values.loc[first_valid])) if first_valid is not None else None
+    parsed = pd.to_datetime(values, errors="coerce", utc=True, format=date_format, cache=True)
+    return parsed.dt.tz_localize(None).dt.as_unit("ns")
+
+
+def _last_of_each_timestamp(sorted_dates: pd.Series) -> np.ndarray:
+    """Mask keeping the last row of every run of equal timestamps in a sorted column."""
+
+    ticks = sorted_dates.to_numpy().view("i8")
+    keep = np.empty(len(ticks), dtype=bool)
+    keep[:-1] = ticks[:-1] != ticks[1:]
+    keep[-1:] = True
+    return keep
+
+
+def _downcast_fleet_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Narrow the known fleet columns to int32/float32, as the Arrow reader types them, when they fit."""
+
+    dtypes = {}
+    for column, dtype in FLEET_COLUMN_DTYPES.items():
+        if column not in df.columns or df[column].dtype == dtype:
+            continue
+        if dtype.startswith("int"):
+            values = df[column].to_numpy()
+            if not np.array_equal(values, np.trunc(values)):
+                dtype = "float32"
+            elif len(values) and (values.min() < np.iinfo(dtype).min or values.max() > np.iinfo(dtype).max):
+                # Counts beyond int32 keep their wider type rather than wrapping around.
+                continue
+        dtypes[column] = dtype
+    return df.astype(dtypes) if dtypes else df
 
 
 def _detect_column(columns: Iterable[str], candidates: Iterable[str]) -> str | None:
-    lookup = {col.lower(): col for col in columns}
-    for candidate in candidates:
-        if candidate in lookup:
-            return lookup[candidate]
-    return None
+    # Column names are already stripped and lower-cased by load_dataset.
+    available = frozenset(columns)
+    return next((candidate for candidate in candidates if candidate in available), None)
 
 
 def load_dataset(
     csv_path: Path | str | IO[str] | IO[bytes] = DEFAULT_DATA_PATH,
+    use_cache: bool = True,
 ) -> pd.DataFrame:
-    """Load the fleet utilization dataset with robust cleaning and validation."""
+    """Load the fleet utilization dataset with robust cleaning and validation.
 
-    raw_df = _read_csv(csv_path)
+    CSV files on disk are cached as ``<name>.cache.parquet`` next to the source
+    and reused until the CSV changes; pass ``use_cache=False`` to always re-parse.
+    """
+
+    raw_df = _read_csv(csv_path, use_cache=use_cache)
     if raw_df.empty:
         raise ValueError("Dataset is empty")
 
@@ -52,25 +217,31 @@ def load_dataset(
     if target_column is None:
         raise ValueError("Dataset must include a utilization rate column")
 
-    df = raw_df.copy()
-    df.rename(columns={date_column: "ds", target_column: "utilization_rate"}, inplace=True)
+    raw_df.rename(columns={date_column: "ds", target_column: "utilization_rate"}, inplace=True)
+    df = raw_df
 
-    df["ds"] = pd.to_datetime(df["ds"], errors="coerce", utc=True).dt.tz_localize(None)
+    df["ds"] = _parse_dates(df["ds"])
     invalid_dates = df["ds"].isna().sum()
     if invalid_dates:
         LOGGER.warning("Dropping %s rows with invalid dates", invalid_dates)
-    df = df.dropna(subset=["ds"]).drop_duplicates(subset=["ds"], keep="last")
+    df = df.dropna(subset=["ds"])
+
+    # Inputs are usually already in date order, where the stable sort runs in linear time.
+    df = df.sort_values("ds", kind="stable")
+    df = df.loc[_last_of_each_timestamp(df["ds"])]
 
     numeric_columns = [col for col in df.columns if col != "ds"]
-    for column in numeric_columns:
-        df[column] = pd.to_numeric(df[column], errors="coerce")
+    unparsed_columns = [col for col in numeric_columns if not pd.api.types.is_numeric_dtype(df[col])]
+    if unparsed_columns:
+        df[unparsed_columns] = df[unparsed_columns].apply(pd.to_numeric, errors="coerce")
 
-    invalid_numeric = df[numeric_columns].isna().any(axis=1)
+    invalid_numeric = np.isnan(df[numeric_columns].to_numpy(dtype=np.float64, na_value=np.nan)).any(axis=1)
     if invalid_numeric.any():
         LOGGER.warning("Dropping %s rows with invalid numeric values", int(invalid_numeric.sum()))
         df = df.loc[~invalid_numeric]
+    df = _downcast_fleet_columns(df)
 
-    df = df.sort_values("ds")
+    # ``ds`` is kept as a column as well because the Prophet wrapper trains from it.
     df = df.set_index("ds", drop=False)
 
     try:
@@ -79,6 +250,8 @@ def load_dataset(
         inferred_freq = None
     if inferred_freq:
         df.index.freq = inferred_freq
+        # The index freq is lost by many operations; attrs survive them for forecast_future.
+        df.attrs["inferred_freq"] = inferred_freq
 
     if df.empty:
         raise ValueError("Dataset did not contain any valid rows after cleaning")
@@ -86,6 +259,49 @@ def load_dataset(
     return df
 
 
+def _arrow_writable(df: pd.DataFrame) -> bool:
+    """Whether Arrow's writer produces the same rows as ``DataFrame.to_csv`` for ``df``."""
+
+    for name, column in df.items():
+        # Arrow cannot write quoted headers and would quote every string value.
+        if not isinstance(name, str) or any(char in name for char in ',"\r\n'):
+            return False
+        if pd.api.types.is_datetime64_any_dtype(column):
+            # A single NaT would switch the whole column to nanosecond precision.
+            if getattr(column.dt, "tz", None) is not None or column.isna().any():
+                return False
+        elif not pd.api.types.is_numeric_dtype(column) or pd.api.types.is_bool_dtype(column):
+            return False
+    return True
+
+
+def write_csv(df: pd.DataFrame, destination: Path | str | IO[bytes]) -> None:
+    """Write ``df`` without its index as CSV.
+
+    Frames of numeric and tz-naive datetime columns, such as forecasts, go through Arrow's
+    multithreaded writer; floats may print in shortest form (``2`` rather than ``2.0``) but
+    parse back to the same values. Anything else is written with ``DataFrame.to_csv``.
+    """
+
+    if not _arrow_writable(df):
+        df.to_csv(destination, index=False)
+        return
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    for position, name in enumerate(table.column_names):
+        column = df[name]
+        if not pd.api.types.is_datetime64_any_dtype(column):
+            continue
+        # Match pandas' output: plain dates at midnight, no fractional part for whole seconds.
+        if (column.dt.normalize() == column).all():
+            table = table.set_column(position, name, table.column(name).cast(pa.date32()))
+        elif (column.dt.floor("s") == column).all():
+            table = table.set_column(position, name, table.column(name).cast(pa.timestamp("s")))
+    if isinstance(destination, Path):
+        destination = str(destination)
+    pacsv.write_csv(table, destination, write_options=pacsv.WriteOptions(quoting_header="none"))
+
+
 def train_test_split_time_series(
     data: pd.DataFrame, test_days: int = 30
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
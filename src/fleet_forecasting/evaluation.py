@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 from typing import Dict
 
 import numpy as np
 import pandas as pd
-from sklearn.metrics import mean_absolute_error, mean_squared_error
 
 
 @dataclass
 class ForecastMetrics:
+    # Declared by hand because ``dataclass(slots=True)`` needs Python 3.10.
+    __slots__ = ("rmse", "mape", "mae")
+
     rmse: float
     mape: float
     mae: float
@@ -23,10 +26,18 @@ class ForecastMetrics:
 def evaluate_forecast(y_true: pd.Series, y_pred: pd.Series) -> ForecastMetrics:
     if len(y_true) != len(y_pred):
         raise ValueError("y_true and y_pred must be the same length")
-
-    rmse = float(np.sqrt(mean_squared_error(y_true, y_pred)))
-    mae = float(mean_absolute_error(y_true, y_pred))
-    with np.errstate(divide="ignore", invalid="ignore"):
-        mape = np.abs((y_true - y_pred) / y_true.replace(0, np.nan)).mean() * 100
-    mape = float(np.nan_to_num(mape))
+    if len(y_true) == 0:
+        raise ValueError("y_true and y_pred must not be empty")
+
+    actual = np.asarray(y_true, dtype=np.float64)
+    predicted = np.asarray(y_pred, dtype=np.float64)
+    # A model that emits NaN must fail here so the pipeline moves on to its fallback.
+    if not (np.isfinite(actual).all() and np.isfinite(predicted).all()):
+        raise ValueError("y_true and y_pred must not contain NaN or infinity")
+    abs_error = np.abs(actual - predicted)
+
+    rmse = math.sqrt(float(np.dot(abs_error, abs_error)) / len(abs_error))
+    mae = float(abs_error.mean())
+    nonzero = actual != 0
+    mape = float((abs_error[nonzero] / np.abs(actual[nonzero])).mean() * 100) if nonzero.any() else 0.0
     return ForecastMetrics(rmse=rmse, mape=mape, mae=mae)
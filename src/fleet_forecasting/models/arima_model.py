@@ -5,37 +5,77 @@ from __future__ import annotations
 import warnings
 from typing import Optional, Tuple
 
+import numpy as np
 import pandas as pd
-from statsmodels.tsa.arima.model import ARIMA, ARIMAResults
+from statsmodels.tsa.statespace.sarimax import SARIMAX, SARIMAXResults
 
 from .base import ForecastModel
 
 
 class ARIMAForecastModel(ForecastModel):
+    needs_ds_column = False
+    # Longest forecast computed so far as (steps, mean, 95% interval); shorter horizons are slices of it.
+    # The class-level default covers models pickled before the memo existed.
+    _last_forecast: Optional[Tuple[int, np.ndarray, np.ndarray]] = None
+
     def __init__(self, order: Tuple[int, int, int] = (2, 1, 2)):
         self.order = order
-        self._model_fit: Optional[ARIMAResults] = None
+        self._model_fit: Optional[SARIMAXResults] = None
+        self._last_forecast = None
 
     def fit(self, history: pd.DataFrame) -> None:
         df = self._coerce_datetime_index(history)
         if self.target_column not in df.columns:
             raise ValueError(f"History must contain '{self.target_column}'")
 
-        series = df[self.target_column].astype(float)
+        series = self._target_series(df)
         freq = df.index.freq or pd.infer_freq(df.index)
         if freq is not None:
             series.index.freq = freq  # type: ignore[attr-defined]
 
-        model = ARIMA(
+        # Same state-space model as statsmodels' ARIMA, with the variance concentrated out
+        # of the likelihood. Parameter covariances are never used, so the Hessian is skipped.
+        # ``low_memory`` is left off: it drops the forecast variances behind the intervals.
+        model = SARIMAX(
             series,
             order=self.order,
             enforce_stationarity=False,
             enforce_invertibility=False,
+            concentrate_scale=True,
+            use_exact_diffuse=False,
         )
         with warnings.catch_warnings():
             warnings.filterwarnings("ignore", category=UserWarning)
             warnings.filterwarnings("ignore", category=RuntimeWarning)
-            self._model_fit = model.fit(method_kwargs={"warn_convergence": False})
+            self._model_fit = model.fit(
+                disp=False,
+                method="lbfgs",
+                maxiter=50,
+                cov_type="none",
+            )
+        self._last_forecast = None
+
+    def update(self, new_history: pd.DataFrame) -> None:
+        """Extend the fitted model with observations that directly follow its data.
+
+        The fitted parameters are kept and only the Kalman filter is run over the new
+        rows, which makes walk-forward backtests much cheaper than refitting.
+        """
+
+        if self._model_fit is None:
+            raise RuntimeError("Model must be fitted before calling update")
+
+        df = self._coerce_datetime_index(new_history)
+        if self.target_column not in df.columns:
+            raise ValueError(f"History must contain '{self.target_column}'")
+        # Plain values: statsmodels extends the date index itself, whereas a short slice may
+        # have lost the frequency that a pandas index would be checked against.
+        self._model_fit = self._model_fit.append(self._target_series(df).to_numpy(), refit=False)
+        self._last_forecast = None
+
+    def _target_series(self, df: pd.DataFrame) -> pd.Series:
+        values = np.ascontiguousarray(df[self.target_column].to_numpy(dtype=np.float64))
+        return pd.Series(values, index=df.index, name=self.target_column)
 
     def predict(self, future: pd.DataFrame) -> pd.DataFrame:
         if self._model_fit is None:
@@ -47,12 +87,17 @@ class ARIMAForecastModel(ForecastModel):
             empty_series = pd.Series(dtype=float, index=future_df.index)
             return self._format_forecast(empty_series, future_df.index)
 
-        forecast_res = self._model_fit.get_forecast(steps=steps)
-        mean = forecast_res.predicted_mean
-        conf_int = forecast_res.conf_int(alpha=0.05)
-        lower = conf_int.iloc[:, 0]
-        upper = conf_int.iloc[:, 1]
-        mean.index = future_df.index
-        lower.index = future_df.index
-        upper.index = future_df.index
+        if self._last_forecast is None or self._last_forecast[0] < steps:
+            start = self._model_fit.nobs
+            forecast_res = self._model_fit.get_prediction(start=start, end=start + steps - 1, dynamic=False)
+            self._last_forecast = (
+                steps,
+                np.asarray(forecast_res.predicted_mean),
+                np.asarray(forecast_res.conf_int(alpha=0.05)),
+            )
+
+        _, cached_mean, cached_conf_int = self._last_forecast
+        mean = pd.Series(cached_mean[:steps], index=future_df.index)
+        lower = pd.Series(cached_conf_int[:steps, 0], index=future_df.index)
+        upper = pd.Series(cached_conf_int[:steps, 1], index=future_df.index)
         return self._format_forecast(mean, future_df.index, lower=lower, upper=upper)
@@ -7,11 +7,15 @@ from pathlib import Path
 from typing import Any
 
 import joblib
+import numpy as np
 import pandas as pd
 
 
 class ForecastModel(ABC):
     target_column: str = "utilization_rate"
+    # Whether predict reads timestamps from a ``ds`` column. The future frame always carries a
+    # ``ds`` DatetimeIndex; backends that only read the index set this to False to skip the column.
+    needs_ds_column: bool = True
 
     @abstractmethod
     def fit(self, history: pd.DataFrame) -> None:
@@ -19,7 +23,7 @@ class ForecastModel(ABC):
 
     @abstractmethod
     def predict(self, future: pd.DataFrame) -> pd.DataFrame:
-        """Forecast the target values for provided timestamps."""
+        """Forecast the target values for provided timestamps as a new dataframe."""
 
     def save(self, path: Path | str) -> None:
         joblib.dump(self, path)
@@ -33,14 +37,21 @@ class ForecastModel(ABC):
 
     @staticmethod
     def _coerce_datetime_index(data: pd.DataFrame) -> pd.DataFrame:
-        df = data.copy()
-        if "ds" in df.columns:
-            df["ds"] = pd.to_datetime(df["ds"], errors="coerce", utc=True).dt.tz_localize(None)
-            df = df.dropna(subset=["ds"])
-            df = df.set_index("ds", drop=False)
+        # Builds a new frame around a tz-naive DatetimeIndex. Its columns share memory with
+        # ``data`` (``copy=False``), so callers must assign new columns rather than write into them.
+        if "ds" in data.columns:
+            index = pd.DatetimeIndex(pd.to_datetime(data["ds"].to_numpy(), errors="coerce", utc=True))
+            index = index.tz_localize(None).rename("ds")
+            df = data.set_axis(index, axis=0, copy=False)
+            df["ds"] = index
+            if index.hasnans:
+                df = df.loc[index.notna()]
         else:
-            df.index = pd.to_datetime(df.index, errors="coerce", utc=True).tz_localize(None)
-        return df.sort_index()
+            index = pd.DatetimeIndex(pd.to_datetime(data.index, errors="coerce", utc=True)).tz_localize(None)
+            df = data.set_axis(index, axis=0, copy=False)
+        if not df.index.is_monotonic_increasing:
+            df = df.sort_index()
+        return df
 
     @staticmethod
     def _format_forecast(
@@ -49,15 +60,16 @@ class ForecastModel(ABC):
         lower: pd.Series | None = None,
         upper: pd.Series | None = None,
     ) -> pd.DataFrame:
-        df = pd.DataFrame({"yhat": predictions.astype(float)}, index=index)
+        # float32 is ample for utilization forecasts and halves what the dashboard ships.
+        df = pd.DataFrame({"yhat": predictions.astype(np.float32)}, index=index)
         if lower is None:
             df["yhat_lower"] = df["yhat"]
         else:
-            df["yhat_lower"] = lower.astype(float)
+            df["yhat_lower"] = lower.astype(np.float32)
         if upper is None:
             df["yhat_upper"] = df["yhat"]
         else:
-            df["yhat_upper"] = upper.astype(float)
+            df["yhat_upper"] = upper.astype(np.float32)
         df.index.name = "ds"
         df["ds"] = df.index
         return df
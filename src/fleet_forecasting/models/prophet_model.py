@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 from prophet import Prophet
 
@@ -22,8 +23,16 @@ class ProphetForecastModel(ForecastModel):
         if self.target_column not in df.columns:
             raise ValueError(f"History must contain target column '{self.target_column}'")
 
-        training_df = df[["ds", self.target_column]].rename(columns={self.target_column: "y"})
-        training_df = training_df.dropna(subset=["y"])
+        # Hand Prophet the exact dtypes it converts to internally so its preprocessing
+        # does not re-parse dates or copy the target.
+        target = np.ascontiguousarray(df[self.target_column].to_numpy(dtype=np.float64, na_value=np.nan))
+        observed = ~np.isnan(target)
+        training_df = pd.DataFrame(
+            {
+                "ds": df.index.to_numpy(dtype="datetime64[ns]")[observed],
+                "y": target[observed],
+            }
+        )
 
         if len(training_df) < 15:
             raise ValueError("Prophet requires at least 15 observations for stable fitting")
@@ -33,7 +42,7 @@ class ProphetForecastModel(ForecastModel):
             weekly_seasonality=self.weekly_seasonality,
             daily_seasonality=False,
         )
-        self._model.fit(training_df[["ds", "y"]])
+        self._model.fit(training_df, algorithm="LBFGS", seed=0)
         self._history = training_df
 
     def predict(self, future: pd.DataFrame) -> pd.DataFrame:
@@ -43,7 +52,9 @@ class ProphetForecastModel(ForecastModel):
         df_future = self._coerce_datetime_index(future)
         ds_values = df_future.index
         forecast = self._model.predict(pd.DataFrame({"ds": ds_values}))
-        forecast["ds"] = pd.to_datetime(forecast["ds"], utc=True).dt.tz_localize(None)
+        # Prophet echoes back the tz-naive datetimes it was given; only re-parse anything else.
+        if not pd.api.types.is_datetime64_dtype(forecast["ds"]):
+            forecast["ds"] = pd.to_datetime(forecast["ds"], utc=True).dt.tz_localize(None)
         forecast = forecast.set_index("ds").loc[ds_values]
         return self._format_forecast(
             predictions=forecast["yhat"],
@@ -0,0 +1,46 @@
+"""statsforecast AutoARIMA implementation for fleet utilization forecasting."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from statsforecast.models import AutoARIMA
+
+from .base import ForecastModel
+
+
+class AutoARIMAForecastModel(ForecastModel):
+    needs_ds_column = False
+
+    def __init__(self, season_length: int = 7):
+        self.season_length = season_length
+        self._model: Optional[AutoARIMA] = None
+
+    def fit(self, history: pd.DataFrame) -> None:
+        df = self._coerce_datetime_index(history)
+        if self.target_column not in df.columns:
+            raise ValueError(f"History must contain '{self.target_column}'")
+
+        # AutoARIMA works on plain values; the dates are re-attached in predict.
+        values = np.ascontiguousarray(df[self.target_column].to_numpy(dtype=np.float64))
+        self._model = AutoARIMA(season_length=self.season_length).fit(values)
+
+    def predict(self, future: pd.DataFrame) -> pd.DataFrame:
+        if self._model is None:
+            raise RuntimeError("Model must be fitted before calling predict")
+
+        future_df = self._coerce_datetime_index(future)
+        steps = len(future_df)
+        if steps == 0:
+            empty_series = pd.Series(dtype=float, index=future_df.index)
+            return self._format_forecast(empty_series, future_df.index)
+
+        forecast = self._model.predict(h=steps, level=[95])
+        return self._format_forecast(
+            pd.Series(np.asarray(forecast["mean"]), index=future_df.index),
+            future_df.index,
+            lower=pd.Series(np.asarray(forecast["lo-95"]), index=future_df.index),
+            upper=pd.Series(np.asarray(forecast["hi-95"]), index=future_df.index),
+        )
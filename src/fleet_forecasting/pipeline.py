@@ -2,28 +2,49 @@
 
 from __future__ import annotations
 
+import importlib
 import logging
-from dataclasses import dataclass
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Sequence, Tuple, Type
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+from pandas.tseries.frequencies import to_offset
 
 from .data import load_dataset, train_test_split_time_series
 from .evaluation import ForecastMetrics, evaluate_forecast
-from .models.arima_model import ARIMAForecastModel
 from .models.base import ForecastModel
-from .models.prophet_model import ProphetForecastModel
 
 
 LOGGER = logging.getLogger(__name__)
 
-MODEL_REGISTRY: Dict[str, Type[ForecastModel]] = {
-    "prophet": ProphetForecastModel,
-    "arima": ARIMAForecastModel,
+NANOSECONDS_PER_DAY = 86_400_000_000_000
+MAX_PROBED_STEP = pd.Timedelta(weeks=1)
+
+# Models are referenced by import path so that choosing one never imports the other's
+# heavy backend (Prophet pulls in cmdstanpy, statsmodels its own stack).
+MODEL_REGISTRY: Dict[str, str] = {
+    "prophet": "fleet_forecasting.models.prophet_model:ProphetForecastModel",
+    "arima": "fleet_forecasting.models.arima_model:ARIMAForecastModel",
+    "auto_arima": "fleet_forecasting.models.statsforecast_model:AutoARIMAForecastModel",
 }
 
 
+def resolve_model(model_name: str) -> Type[ForecastModel]:
+    """Import and return the model class registered under ``model_name``."""
+
+    if model_name not in MODEL_REGISTRY:
+        raise KeyError(f"Unknown model '{model_name}'. Options: {list(MODEL_REGISTRY)}")
+    module_name, class_name = MODEL_REGISTRY[model_name].split(":")
+    model_cls = getattr(importlib.import_module(module_name), class_name)
+    if not (isinstance(model_cls, type) and issubclass(model_cls, ForecastModel)):
+        raise TypeError(f"Registered model '{model_name}' is not a ForecastModel")
+    return model_cls
+
+
 @dataclass
 class PipelineResult:
     model_name: str
@@ -32,15 +53,66 @@ class PipelineResult:
     model: ForecastModel
     train: pd.DataFrame
     test: pd.DataFrame
+    data: pd.DataFrame
+    _full_model: Optional[ForecastModel] = field(default=None, init=False, repr=False)
+
+    @property
+    def full_model(self) -> ForecastModel:
+        """Model of the same kind refitted on the full dataset, trained on first access.
+
+        ``model`` only saw the training split, and ARIMA forecasts continue from the end
+        of the series it was fitted on, so future forecasts need a model fitted on ``data``.
+        """
+
+        if self._full_model is None:
+            model = resolve_model(self.model_name)()
+            model.fit(self.data)
+            self._full_model = model
+        return self._full_model
 
 
 def _resolve_model_order(model_name: str, fallback_order: Sequence[str] | None) -> List[str]:
-    order: List[str] = [model_name]
-    if fallback_order:
-        for candidate in fallback_order:
-            if candidate not in order:
-                order.append(candidate)
-    return order
+    return list(dict.fromkeys([model_name, *(fallback_order or ())]))
+
+
+def _load_data(dataset_path: Path | str | None, dataset: Optional[pd.DataFrame]) -> pd.DataFrame:
+    if dataset is not None:
+        return dataset.copy()
+    return load_dataset(dataset_path) if dataset_path else load_dataset()
+
+
+def _fit_and_evaluate(
+    model_name: str, train: pd.DataFrame, test: pd.DataFrame
+) -> Tuple[ForecastModel, pd.DataFrame, ForecastMetrics]:
+    model = resolve_model(model_name)()
+    model.fit(train)
+    predictions = model.predict(test)
+    if "yhat" not in predictions.columns:
+        raise ValueError("Model predictions must include a 'yhat' column")
+    metrics = evaluate_forecast(test[model.target_column], predictions["yhat"])
+    return model, predictions, metrics
+
+
+def _serialize_frame(df: pd.DataFrame) -> pa.Buffer:
+    """Encode a frame and its index as an Arrow IPC stream for worker processes."""
+
+    # Arrow stores the index under a reserved name when a ``ds`` column also exists.
+    table = pa.Table.from_pandas(df, preserve_index=True)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+
+def _deserialize_frame(payload: pa.Buffer) -> pd.DataFrame:
+    table = pa.ipc.open_stream(payload).read_all()
+    return table.to_pandas(self_destruct=True)
+
+
+def _fit_and_evaluate_serialized(
+    model_name: str, train_payload: pa.Buffer, test_payload: pa.Buffer
+) -> Tuple[ForecastModel, pd.DataFrame, ForecastMetrics]:
+    return _fit_and_evaluate(model_name, _deserialize_frame(train_payload), _deserialize_frame(test_payload))
 
 
 def run_training_pipeline(
@@ -49,42 +121,248 @@ def run_training_pipeline(
     dataset: Optional[pd.DataFrame] = None,
     test_days: int = 30,
     fallback_models: Sequence[str] | None = ("arima",),
+    parallel: bool = False,
 ) -> PipelineResult:
-    """Train a forecasting model with optional fallbacks for robustness."""
+    """Train a forecasting model with optional fallbacks for robustness.
+
+    With ``parallel`` the primary model and its fallbacks train speculatively in separate
+    processes, so a failing primary costs no extra wall time. The first model in priority
+    order that succeeds is returned either way.
+    """
 
     if model_name not in MODEL_REGISTRY:
         raise KeyError(f"Unknown model '{model_name}'. Options: {list(MODEL_REGISTRY)}")
 
-    data = dataset.copy() if dataset is not None else load_dataset(dataset_path) if dataset_path else load_dataset()
+    data = _load_data(dataset_path, dataset)
     train, test = train_test_split_time_series(data, test_days=test_days)
 
-    errors: List[Tuple[str, Exception]] = []
+    candidates: List[str] = []
     for candidate_name in _resolve_model_order(model_name, fallback_models):
-        model_cls = MODEL_REGISTRY.get(candidate_name)
-        if model_cls is None:
+        if candidate_name not in MODEL_REGISTRY:
             LOGGER.warning("Skipping unknown model '%s' in fallback list", candidate_name)
             continue
-        model = model_cls()
-        try:
-            model.fit(train)
-            predictions = model.predict(test)
-            if "yhat" not in predictions.columns:
-                raise ValueError("Model predictions must include a 'yhat' column")
-            metrics = evaluate_forecast(test[model.target_column], predictions["yhat"])
-            return PipelineResult(
-                model_name=candidate_name,
+        candidates.append(candidate_name)
+
+    executor: Optional[ProcessPoolExecutor] = None
+    futures: Dict[str, Future] = {}
+    if parallel and len(candidates) > 1:
+        executor = ProcessPoolExecutor(max_workers=len(candidates))
+        train_payload = _serialize_frame(train)
+        test_payload = _serialize_frame(test)
+        futures = {
+            name: executor.submit(_fit_and_evaluate_serialized, name, train_payload, test_payload)
+            for name in candidates
+        }
+
+    errors: List[Tuple[str, Exception]] = []
+    try:
+        for candidate_name in candidates:
+            try:
+                if executor is not None:
+                    model, predictions, metrics = futures[candidate_name].result()
+                else:
+                    model, predictions, metrics = _fit_and_evaluate(candidate_name, train, test)
+                return PipelineResult(
+                    model_name=candidate_name,
+                    metrics=metrics,
+                    forecast=predictions,
+                    model=model,
+                    train=train,
+                    test=test,
+                    data=data,
+                )
+            except Exception as exc:  # pragma: no cover - error path
+                LOGGER.exception("Model '%s' failed during training", candidate_name)
+                errors.append((candidate_name, exc))
+    finally:
+        if executor is not None:
+            # Lower-priority fits still queued are dropped; ones already running finish
+            # in the background and their results are discarded.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    error_messages = ", ".join(f"{name}: {error}" for name, error in errors) or "no models tried"
+    raise RuntimeError(f"All models failed to train successfully ({error_messages})")
+
+
+def run_training_pipeline_all(
+    dataset_path: Path | str | None = None,
+    dataset: Optional[pd.DataFrame] = None,
+    test_days: int = 30,
+) -> Dict[str, PipelineResult]:
+    """Train and evaluate every registered model concurrently, one process per model.
+
+    Models that fail are logged and left out of the result.
+    """
+
+    data = _load_data(dataset_path, dataset)
+    train, test = train_test_split_time_series(data, test_days=test_days)
+    train_payload = _serialize_frame(train)
+    test_payload = _serialize_frame(test)
+
+    results: Dict[str, PipelineResult] = {}
+    errors: List[Tuple[str, Exception]] = []
+    with ProcessPoolExecutor(max_workers=len(MODEL_REGISTRY)) as executor:
+        futures = {
+            name: executor.submit(_fit_and_evaluate_serialized, name, train_payload, test_payload)
+            for name in MODEL_REGISTRY
+        }
+        for name, future in futures.items():
+            try:
+                model, predictions, metrics = future.result()
+            except Exception as exc:  # pragma: no cover - error path
+                LOGGER.error("Model '%s' failed during training: %s", name, exc)
+                errors.append((name, exc))
+                continue
+            results[name] = PipelineResult(
+                model_name=name,
                 metrics=metrics,
                 forecast=predictions,
                 model=model,
                 train=train,
                 test=test,
+                data=data,
             )
-        except Exception as exc:  # pragma: no cover - error path
-            LOGGER.exception("Model '%s' failed during training", candidate_name)
-            errors.append((candidate_name, exc))
 
-    error_messages = ", ".join(f"{name}: {error}" for name, error in errors) or "no models tried"
-    raise RuntimeError(f"All models failed to train successfully ({error_messages})")
+    if not results:
+        error_messages = ", ".join(f"{name}: {error}" for name, error in errors) or "no models tried"
+        raise RuntimeError(f"All models failed to train successfully ({error_messages})")
+    return results
+
+
+def walk_forward_backtest(
+    model_name: str = "arima",
+    dataset_path: Path | str | None = None,
+    dataset: Optional[pd.DataFrame] = None,
+    test_days: int = 30,
+) -> PipelineResult:
+    """Evaluate one-step-ahead forecasts across the test window.
+
+    After each step the observed value is fed back to the model. Models exposing an
+    ``update`` method are extended incrementally; others are refitted on the expanded
+    history.
+    """
+
+    if model_name not in MODEL_REGISTRY:
+        raise KeyError(f"Unknown model '{model_name}'. Options: {list(MODEL_REGISTRY)}")
+
+    data = _load_data(dataset_path, dataset)
+    if not data.index.is_monotonic_increasing:
+        # Refits below take positional slices of ``data``, which must be in time order.
+        data = data.sort_index()
+    train, test = train_test_split_time_series(data, test_days=test_days)
+    model = resolve_model(model_name)()
+    model.fit(train)
+
+    steps: List[pd.DataFrame] = []
+    for position in range(len(test)):
+        observation = test.iloc[position : position + 1]
+        steps.append(model.predict(observation))
+        if hasattr(model, "update"):
+            model.update(observation)
+        else:
+            model.fit(data.iloc[: len(train) + position + 1])
+
+    predictions = pd.concat(steps)
+    metrics = evaluate_forecast(test[model.target_column], predictions["yhat"])
+    return PipelineResult(
+        model_name=model_name,
+        metrics=metrics,
+        forecast=predictions,
+        model=model,
+        train=train,
+        test=test,
+        data=data,
+    )
+
+
+def run_rolling_cv(
+    model_name: str = "prophet",
+    dataset_path: Path | str | None = None,
+    dataset: Optional[pd.DataFrame] = None,
+    n_splits: int = 3,
+    horizon: int = 30,
+) -> pd.DataFrame:
+    """Rolling-origin cross-validation over the last ``n_splits * horizon`` rows.
+
+    Each fold trains on every row before its window (an expanding window) and forecasts
+    the next ``horizon`` rows. Returns one row of metrics per fold.
+    """
+
+    if n_splits <= 0 or horizon <= 0:
+        raise ValueError("n_splits and horizon must be positive")
+
+    data = _load_data(dataset_path, dataset)
+    if len(data) <= n_splits * horizon:
+        raise ValueError("Dataset must be longer than n_splits * horizon")
+    if not data.index.is_monotonic_increasing:
+        data = data.sort_index()
+
+    model_cls = resolve_model(model_name)
+    folds = []
+    for fold in range(n_splits):
+        # Positional slices are views of ``data``; no per-fold copies are made.
+        train_end = len(data) - (n_splits - fold) * horizon
+        train = data.iloc[:train_end]
+        test = data.iloc[train_end : train_end + horizon]
+        model = model_cls()
+        model.fit(train)
+        predictions = model.predict(test)
+        metrics = evaluate_forecast(test[model.target_column], predictions["yhat"])
+        folds.append({"fold": fold + 1, "train_end": train.index[-1], **metrics.to_dict()})
+    return pd.DataFrame(folds)
+
+
+def _fixed_step_nanos(freq: pd.Timedelta | pd.DateOffset | str) -> Optional[int]:
+    """Step length in nanoseconds for fixed-width frequencies, ``None`` for calendar ones."""
+
+    if isinstance(freq, pd.Timedelta):
+        return freq.value
+    offset = to_offset(freq)
+    if offset == pd.offsets.Day(offset.n):
+        return offset.n * NANOSECONDS_PER_DAY
+    if isinstance(offset, pd.offsets.Tick):
+        return offset.nanos
+    return None
+
+
+def _fixed_step_future_index(last_timestamp: pd.Timestamp, step: int, periods: int) -> pd.DatetimeIndex:
+    """Build the next ``periods`` timestamps with int64 arithmetic instead of offset machinery."""
+
+    ticks = last_timestamp.value + np.arange(1, periods + 1, dtype=np.int64) * step
+    # No ``freq=``: pandas would rebuild the whole range to validate it, and callers never read it.
+    return pd.DatetimeIndex(ticks.view("datetime64[ns]"))
+
+
+def _infer_frequency(
+    index: pd.DatetimeIndex, hint: pd.DateOffset | str | None = None
+) -> pd.Timedelta | pd.DateOffset | str:
+    if index.freq is not None:
+        return index.freq
+
+    # ``hint`` is the frequency load_dataset recorded. attrs survive resampling and row
+    # filtering, so it is only trusted when the first step, the last step and the overall
+    # span all agree with it, as in the probe below.
+    if hint is not None and len(index) >= 2:
+        offset = to_offset(hint)
+        first, last = index[0], index[-1]
+        span_matches = first + (len(index) - 1) * offset == last
+        if index[1] == first + offset and index[-2] + offset == last and span_matches:
+            return hint
+
+    # Probe the first and last spacing and the overall span before scanning the whole
+    # index. Only steps up to a week are trusted: longer calendar frequencies (months,
+    # quarters) vary in length.
+    if len(index) >= 2:
+        values = index.values
+        first_step = values[1] - values[0]
+        regular = first_step == values[-1] - values[-2] and values[-1] - values[0] == first_step * (len(values) - 1)
+        if regular and pd.Timedelta(0) < first_step <= MAX_PROBED_STEP:
+            return pd.Timedelta(first_step)
+
+    inferred_freq = pd.infer_freq(index) if len(index) >= 3 else None
+    if inferred_freq is None:
+        inferred_freq = pd.Timedelta(index.to_series().diff().dropna().median() or pd.Timedelta(days=1))
+    return inferred_freq
 
 
 def forecast_future(
@@ -96,22 +374,27 @@ def forecast_future(
 
     if periods <= 0:
         raise ValueError("periods must be positive")
-    if history.empty:
-        raise ValueError("history must contain data")
+    if len(history) < 2:
+        raise ValueError("history must contain at least two rows to infer a frequency")
 
-    history = history.sort_index()
+    if not history.index.is_monotonic_increasing:
+        history = history.sort_index()
     last_timestamp = history.index[-1]
-    inferred_freq = history.index.freq or pd.infer_freq(history.index)
-    if inferred_freq is None:
-        inferred_freq = pd.Timedelta(history.index.to_series().diff().dropna().median() or pd.Timedelta(days=1))
-    if isinstance(inferred_freq, pd.Timedelta):
+    inferred_freq = _infer_frequency(history.index, history.attrs.get("inferred_freq"))
+    step = _fixed_step_nanos(inferred_freq)
+    if last_timestamp.tz is None and step is not None and step > 0:
+        future_index = _fixed_step_future_index(last_timestamp, step, periods)
+    elif isinstance(inferred_freq, pd.Timedelta):
         future_index = pd.date_range(last_timestamp + inferred_freq, periods=periods, freq=inferred_freq)
     else:
         future_index = pd.date_range(last_timestamp, periods=periods + 1, freq=inferred_freq)[1:]
 
-    future_df = pd.DataFrame({"ds": future_index})
-    future_df = future_df.set_index("ds", drop=False)
+    future_index = future_index.rename("ds")
+    if model.needs_ds_column:
+        # Column and index share one array, so models may read either.
+        future_df = pd.DataFrame({"ds": future_index}, index=future_index, copy=False)
+    else:
+        future_df = pd.DataFrame(index=future_index)
     forecast = model.predict(future_df)
-    forecast = forecast.copy()
     forecast["ds"] = forecast.index
     return forecast
@@ -2,17 +2,24 @@
 
 from __future__ import annotations
 
-import hashlib
 import io
 import logging
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
+import pyarrow as pa
 import streamlit as st
 
-from fleet_forecasting.data import load_dataset
-from fleet_forecasting.pipeline import MODEL_REGISTRY, PipelineResult, forecast_future, run_training_pipeline
+from fleet_forecasting.data import DEFAULT_DATA_PATH, load_dataset, write_csv
+from fleet_forecasting.pipeline import (
+    MODEL_REGISTRY,
+    PipelineResult,
+    forecast_future,
+    run_rolling_cv,
+    run_training_pipeline,
+)
 
 
 LOGGER = logging.getLogger(__name__)
@@ -24,22 +31,43 @@ def _configure_logging() -> None:
 
 
 def _hash_dataframe(df: pd.DataFrame) -> str:
-    hashed = pd.util.hash_pandas_object(df, index=True).values.tobytes()
-    return hashlib.md5(hashed).hexdigest()
+    # pandas already produces a 64-bit hash per row (index included); folding them with XOR
+    # avoids copying the hashes into bytes and running MD5 over them.
+    row_hashes = pd.util.hash_pandas_object(df, index=True, categorize=False).to_numpy()
+    return f"{np.bitwise_xor.reduce(row_hashes):016x}"
 
 
 @st.cache_data(show_spinner=False)
-def _load_data(file_bytes: Optional[bytes]) -> pd.DataFrame:
+def _load_data(file_bytes: Optional[bytes], sample_mtime_ns: int) -> pd.DataFrame:
+    # ``sample_mtime_ns`` only keys the cache, so edits to the bundled sample are picked up.
     if file_bytes:
         return load_dataset(io.BytesIO(file_bytes))
     return load_dataset()
 
 
-@st.cache_resource(show_spinner=False, hash_funcs={pd.DataFrame: _hash_dataframe})
+@st.cache_data(show_spinner=False, max_entries=16, hash_funcs={pd.DataFrame: _hash_dataframe})
 def _train_model_cached(model_name: str, dataset: pd.DataFrame, test_days: int) -> PipelineResult:
     return run_training_pipeline(model_name=model_name, dataset=dataset, test_days=test_days)
 
 
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: _hash_dataframe})
+def _rolling_cv_cached(model_name: str, dataset: pd.DataFrame, n_splits: int, horizon: int) -> pd.DataFrame:
+    return run_rolling_cv(model_name=model_name, dataset=dataset, n_splits=n_splits, horizon=horizon)
+
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: _hash_dataframe})
+def _arrow_preview(rows: pd.DataFrame) -> pa.Table:
+    # Callers pass only the rows shown, so the cache key hashes 20 rows, not the dataset.
+    # The ds index duplicates the ds column, so it is left out of the preview.
+    return pa.Table.from_pandas(rows, preserve_index=False)
+
+
+def _forecast_csv_bytes(forecast: pd.DataFrame) -> bytes:
+    buffer = io.BytesIO()
+    write_csv(forecast, buffer)
+    return buffer.getvalue()
+
+
 def _render_metrics(result: PipelineResult) -> None:
     col1, col2, col3 = st.columns(3)
     col1.metric("RMSE", f"{result.metrics.rmse:.4f}")
@@ -48,50 +76,40 @@ def _render_metrics(result: PipelineResult) -> None:
 
 
 def _build_forecast_chart(history: pd.DataFrame, backtest: pd.DataFrame, future: pd.DataFrame) -> go.Figure:
-    fig = go.Figure()
-
-    fig.add_trace(
+    traces = [
         go.Scatter(
             x=history.index,
             y=history["utilization_rate"],
             mode="lines",
             name="Actual utilization",
             line=dict(color="#1f77b4"),
-        )
-    )
-
-    fig.add_trace(
+        ),
         go.Scatter(
             x=backtest.index,
             y=backtest["yhat"],
             mode="lines",
             name="Backtest forecast",
             line=dict(color="#ff7f0e"),
-        )
-    )
-
-    fig.add_trace(
+        ),
         go.Scatter(
             x=future.index,
             y=future["yhat"],
             mode="lines",
             name="Future forecast",
             line=dict(color="#2ca02c"),
-        )
-    )
-
-    fig.add_trace(
+        ),
         go.Scatter(
-            x=list(future.index) + list(future.index[::-1]),
-            y=list(future["yhat_upper"]) + list(future["yhat_lower"][::-1]),
+            x=np.concatenate([future.index.values, future.index.values[::-1]]),
+            y=np.concatenate([future["yhat_upper"].to_numpy(), future["yhat_lower"].to_numpy()[::-1]]),
             fill="toself",
             fillcolor="rgba(44, 160, 44, 0.1)",
             line=dict(color="rgba(255,255,255,0)"),
             hoverinfo="skip",
             showlegend=True,
             name="Forecast interval",
-        )
-    )
+        ),
+    ]
+    fig = go.Figure(data=traces)
 
     fig.update_layout(
         xaxis_title="Date",
@@ -119,12 +137,15 @@ def main() -> None:
         test_days = st.slider("Validation window (days)", min_value=7, max_value=90, value=30, step=7)
         forecast_horizon = st.slider("Forecast horizon (days)", min_value=7, max_value=120, value=30, step=7)
         show_components = st.checkbox("Show Prophet components (if available)", value=False)
+        run_cv = st.checkbox("Run rolling-origin cross-validation", value=False)
+        cv_folds = st.slider("Cross-validation folds", min_value=2, max_value=6, value=3, disabled=not run_cv)
 
     file_bytes = uploaded_file.getvalue() if uploaded_file else None
 
     try:
         with st.spinner("Loading dataset..."):
-            dataset = _load_data(file_bytes)
+            sample_mtime_ns = 0 if file_bytes else DEFAULT_DATA_PATH.stat().st_mtime_ns
+            dataset = _load_data(file_bytes, sample_mtime_ns)
         st.success("Dataset loaded successfully")
     except Exception as exc:  # pragma: no cover - UI feedback path
         LOGGER.exception("Failed to load dataset")
@@ -132,7 +153,7 @@ def main() -> None:
         st.stop()
 
     st.subheader("Dataset preview")
-    st.dataframe(dataset.tail(20), use_container_width=True)
+    st.dataframe(_arrow_preview(dataset.tail(20)), use_container_width=True)
 
     st.caption(
         f"Rows: {len(dataset):,} · Columns: {', '.join(dataset.columns)}"
@@ -153,6 +174,16 @@ def main() -> None:
 
     _render_metrics(pipeline_result)
 
+    if run_cv:
+        try:
+            with st.spinner("Running rolling-origin cross-validation..."):
+                cv_results = _rolling_cv_cached(pipeline_result.model_name, dataset, cv_folds, test_days)
+            st.subheader("Rolling-origin cross-validation")
+            st.dataframe(cv_results, use_container_width=True)
+        except Exception as exc:  # pragma: no cover - UI feedback path
+            LOGGER.exception("Cross-validation failed")
+            st.warning(f"Unable to run cross-validation: {exc}")
+
     try:
         with st.spinner("Generating future forecast..."):
             future_forecast = forecast_future(pipeline_result.model, dataset, periods=forecast_horizon)
@@ -171,7 +202,7 @@ def main() -> None:
     st.dataframe(forecast_output, use_container_width=True)
     st.download_button(
         label="Download forecast CSV",
-        data=forecast_output.to_csv(index=False).encode("utf-8"),
+        data=_forecast_csv_bytes(forecast_output),
         file_name="fleet_utilization_forecast.csv",
         mime="text/csv",
     )
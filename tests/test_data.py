@@ -0,0 +1,85 @@
+import io
+import os
+
+import pandas as pd
+import pytest
+
+from fleet_forecasting.data import DEFAULT_DATA_PATH, load_dataset, write_csv
+
+
+def test_load_dataset_reuses_parquet_cache_until_csv_changes(tmp_path) -> None:
+    csv_path = tmp_path / "fleet.csv"
+    csv_path.write_text(DEFAULT_DATA_PATH.read_text())
+    cache_path = tmp_path / "fleet.csv.cache.parquet"
+
+    first = load_dataset(csv_path)
+    assert cache_path.exists()
+    pd.testing.assert_frame_equal(first, load_dataset(csv_path))
+
+    csv_path.write_text("date,utilization_rate\n2021-01-01,0.5\n2021-01-02,0.6\n")
+    os.utime(csv_path, ns=(cache_path.stat().st_mtime_ns + 1, cache_path.stat().st_mtime_ns + 1))
+    assert len(load_dataset(csv_path)) == 2
+
+
+def test_load_dataset_leaves_unrelated_parquet_files_alone(tmp_path) -> None:
+    csv_path = tmp_path / "fleet.csv"
+    csv_path.write_text(DEFAULT_DATA_PATH.read_text())
+    user_file = tmp_path / "fleet.parquet"
+    user_file.write_bytes(b"not a cache")
+    foreign_cache = tmp_path / "fleet.csv.cache.parquet"
+    pd.DataFrame({"x": [1]}).to_parquet(foreign_cache)
+    foreign_bytes = foreign_cache.read_bytes()
+
+    load_dataset(csv_path)
+    assert user_file.read_bytes() == b"not a cache"
+    assert foreign_cache.read_bytes() == foreign_bytes
+
+
+def test_write_csv_keeps_plain_dates(tmp_path) -> None:
+    frame = pd.DataFrame({"date": pd.date_range("2023-01-01", periods=2), "utilization_rate": [0.5, 0.25]})
+    target = tmp_path / "forecast.csv"
+    write_csv(frame, target)
+    assert target.read_text().splitlines() == ["date,utilization_rate", "2023-01-01,0.5", "2023-01-02,0.25"]
+
+    hourly = frame.assign(date=pd.date_range("2023-01-01 01:00", periods=2, freq="h"))
+    write_csv(hourly, target)
+    assert target.read_text().splitlines() == [
+        "date,utilization_rate",
+        "2023-01-01 01:00:00,0.5",
+        "2023-01-01 02:00:00,0.25",
+    ]
+    assert target.read_text() == hourly.to_csv(index=False)
+
+
+@pytest.mark.parametrize(
+    "rows",
+    [
+        "2021-01-01,0.5\n2021-01-02,0.6\n",
+        "2021-01-01T00:00:00+02:00,0.5\n2021-01-02T00:00:00+02:00,0.6\n",
+        "2021-01-01,0.5\n2021-01-02,bad\n2021-01-03,0.6\n",
+    ],
+)
+def test_load_dataset_returns_nanosecond_dates(rows: str) -> None:
+    df = load_dataset(io.StringIO("date,utilization_rate\n" + rows))
+    assert df["ds"].dtype == "datetime64[ns]"
+    assert df.index.dtype == "datetime64[ns]"
+
+
+def test_load_dataset_keeps_counts_beyond_int32() -> None:
+    csv = "date,total_fleet,utilization_rate\n2021-01-01,3000000000,0.5\n2021-01-02,12,0.6\n"
+    df = load_dataset(io.StringIO(csv))
+    assert df["total_fleet"].tolist() == [3000000000, 12]
+    assert df["utilization_rate"].dtype == "float32"
+
+
+def test_write_csv_matches_pandas_for_text_and_missing_dates(tmp_path) -> None:
+    frame = pd.DataFrame(
+        {
+            'fleet, "north"': ["a", "b"],
+            "date": [pd.Timestamp("2023-01-01 01:00"), pd.NaT],
+            "utilization_rate": [0.5, 0.25],
+        }
+    )
+    target = tmp_path / "forecast.csv"
+    write_csv(frame, target)
+    assert target.read_text() == frame.to_csv(index=False)
@@ -0,0 +1,22 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fleet_forecasting.evaluation import evaluate_forecast
+
+
+def test_evaluate_forecast_skips_zero_actuals_in_mape() -> None:
+    y_true = pd.Series([0.0, 0.5, 1.0])
+    y_pred = pd.Series([0.1, 0.4, 1.2])
+    metrics = evaluate_forecast(y_true, y_pred)
+    assert metrics.rmse == pytest.approx(np.sqrt((0.01 + 0.01 + 0.04) / 3))
+    assert metrics.mae == pytest.approx(0.4 / 3)
+    assert metrics.mape == pytest.approx((0.2 + 0.2) / 2 * 100)
+
+
+@pytest.mark.parametrize("bad_value", [np.nan, np.inf])
+def test_evaluate_forecast_rejects_non_finite_values(bad_value: float) -> None:
+    with pytest.raises(ValueError):
+        evaluate_forecast(pd.Series([0.5, 0.6]), pd.Series([0.5, bad_value]))
+    with pytest.raises(ValueError):
+        evaluate_forecast(pd.Series([bad_value, 0.6]), pd.Series([0.5, 0.6]))
@@ -1,5 +1,45 @@
+import time
+
+import pandas as pd
+import pytest
+
 from fleet_forecasting.data import load_dataset
-from fleet_forecasting.pipeline import forecast_future, run_training_pipeline
+from fleet_forecasting.models.base import ForecastModel
+from fleet_forecasting.pipeline import (
+    MODEL_REGISTRY,
+    forecast_future,
+    run_rolling_cv,
+    run_training_pipeline,
+    run_training_pipeline_all,
+    walk_forward_backtest,
+)
+
+
+class LastValueModel(ForecastModel):
+    """Repeats the last observed value and fails if asked to predict into its own history."""
+
+    def fit(self, history: pd.DataFrame) -> None:
+        self._last_timestamp = history.index.max()
+        self._last_value = float(history.loc[self._last_timestamp, self.target_column])
+
+    def predict(self, future: pd.DataFrame) -> pd.DataFrame:
+        index = self._coerce_datetime_index(future).index
+        assert index.min() > self._last_timestamp, "model was trained on rows it is asked to predict"
+        return self._format_forecast(pd.Series(self._last_value, index=index), index)
+
+
+class FailingModel(ForecastModel):
+    def fit(self, history: pd.DataFrame) -> None:
+        raise RuntimeError("fit failed")
+
+    def predict(self, future: pd.DataFrame) -> pd.DataFrame:
+        raise AssertionError("predict must not be reached")
+
+
+class SlowLastValueModel(LastValueModel):
+    def fit(self, history: pd.DataFrame) -> None:
+        time.sleep(1)
+        super().fit(history)
 
 
 def test_run_training_pipeline_returns_forecast_dataframe() -> None:
@@ -16,3 +56,110 @@ def test_forecast_future_extends_timeline() -> None:
     future = forecast_future(result.model, dataset, periods=10)
     assert len(future) == 10
     assert future.index[0] > dataset.index[-1]
+
+
+def test_forecast_future_ignores_a_stale_frequency_hint_after_filtering() -> None:
+    dataset = load_dataset()
+    start = dataset.index[dataset.index.dayofweek == 0][0]
+    weekdays = dataset.loc[(dataset.index >= start) & (dataset.index.dayofweek < 5)]
+    assert weekdays.attrs["inferred_freq"] == "D"
+    model = LastValueModel()
+    model.fit(weekdays)
+    future = forecast_future(model, weekdays, periods=10)
+    assert (future.index.dayofweek < 5).all()
+
+
+def test_forecast_future_rejects_a_single_row_history() -> None:
+    dataset = load_dataset()
+    with pytest.raises(ValueError, match="at least two rows"):
+        forecast_future(LastValueModel(), dataset.iloc[:1], periods=3)
+
+
+def test_run_training_pipeline_all_trains_every_registered_model() -> None:
+    dataset = load_dataset()
+    results = run_training_pipeline_all(dataset=dataset, test_days=14)
+    assert set(results) == set(MODEL_REGISTRY)
+    for name, result in results.items():
+        assert result.model_name == name
+        assert len(result.forecast) == 14
+        assert result.metrics.mae >= 0
+
+
+def test_parallel_training_keeps_an_index_only_dataset() -> None:
+    dataset = load_dataset().drop(columns=["ds"])
+    result = run_training_pipeline(model_name="prophet", dataset=dataset, test_days=14, parallel=True)
+    assert result.model_name == "prophet"
+    assert len(result.forecast) == 14
+
+
+def test_walk_forward_backtest_predicts_each_test_day() -> None:
+    dataset = load_dataset()
+    result = walk_forward_backtest(model_name="arima", dataset=dataset, test_days=7)
+    assert len(result.forecast) == 7
+    assert result.forecast.index.equals(result.test.index)
+    assert result.metrics.rmse >= 0
+
+
+def test_walk_forward_backtest_refits_on_past_rows_of_unsorted_data(monkeypatch) -> None:
+    monkeypatch.setitem(MODEL_REGISTRY, "last_value", f"{__name__}:LastValueModel")
+    dataset = load_dataset().sample(frac=1, random_state=0)
+    result = walk_forward_backtest(model_name="last_value", dataset=dataset, test_days=5)
+    assert result.test.index.is_monotonic_increasing
+    assert len(result.forecast) == 5
+
+
+def test_parallel_training_falls_back_when_the_primary_fails(monkeypatch) -> None:
+    monkeypatch.setitem(MODEL_REGISTRY, "failing", f"{__name__}:FailingModel")
+    monkeypatch.setitem(MODEL_REGISTRY, "last_value", f"{__name__}:LastValueModel")
+    result = run_training_pipeline(
+        model_name="failing", dataset=load_dataset(), test_days=14, fallback_models=("last_value",), parallel=True
+    )
+    assert result.model_name == "last_value"
+    assert len(result.forecast) == 14
+
+
+def test_parallel_training_keeps_priority_when_a_fallback_finishes_first(monkeypatch) -> None:
+    monkeypatch.setitem(MODEL_REGISTRY, "slow", f"{__name__}:SlowLastValueModel")
+    monkeypatch.setitem(MODEL_REGISTRY, "last_value", f"{__name__}:LastValueModel")
+    result = run_training_pipeline(
+        model_name="slow", dataset=load_dataset(), test_days=14, fallback_models=("last_value",), parallel=True
+    )
+    assert result.model_name == "slow"
+
+
+def test_run_rolling_cv_reports_each_fold() -> None:
+    dataset = load_dataset()
+    folds = run_rolling_cv(model_name="arima", dataset=dataset, n_splits=3, horizon=14)
+    assert list(folds["fold"]) == [1, 2, 3]
+    assert folds["train_end"].is_monotonic_increasing
+    assert (folds["rmse"] >= 0).all()
+
+
+def test_run_rolling_cv_sorts_unsorted_data() -> None:
+    dataset = load_dataset().sample(frac=1, random_state=0)
+    folds = run_rolling_cv(model_name="arima", dataset=dataset, n_splits=2, horizon=7)
+    assert folds["train_end"].is_monotonic_increasing
+    assert (folds["rmse"] >= 0).all()
+
+
+def test_forecast_future_passes_a_datetime_index_to_models() -> None:
+    class IndexReadingModel(ForecastModel):
+        def fit(self, history: pd.DataFrame) -> None:
+            pass
+
+        def predict(self, future: pd.DataFrame) -> pd.DataFrame:
+            assert isinstance(future.index, pd.DatetimeIndex) and future.index.name == "ds"
+            return self._format_forecast(pd.Series(0.5, index=future.index), future.index)
+
+    forecast = forecast_future(IndexReadingModel(), load_dataset(), periods=5)
+    assert len(forecast) == 5
+
+
+def test_arima_model_pickled_without_forecast_memo_still_predicts(tmp_path) -> None:
+    result = run_training_pipeline(model_name="arima", dataset=load_dataset(), test_days=14)
+    model = result.model
+    del model.__dict__["_last_forecast"]
+    path = tmp_path / "arima.joblib"
+    model.save(path)
+    restored = ForecastModel.load(path)
+    assert len(restored.predict(result.test)) == 14